@@ -1,11 +1,21 @@
 import asyncio
+import atexit
+import functools
 import hashlib
 import json
+import logging
+import os
+import tempfile
+import time
 from types import SimpleNamespace  # for SpoonOS message objects
 
+import numpy as np
+import orjson
 from spoon_ai.llm import LLMManager, ConfigurationManager
 from spoon_ai.tools.base import BaseTool
 
+log = logging.getLogger("verisci")
+
 
 SYSTEM_PROMPT = """
 You are VeriSci, an AI assistant that evaluates the credibility of scientific claims.
@@ -19,13 +29,194 @@ You MUST respond with valid JSON only, using this schema:
 }
 """
 
+# The system message is identical for every claim, so build it once and keep
+# the prompt prefix byte-for-byte stable (providers can then reuse their
+# cached prefix). One form for the direct OpenAI call (dict) and one for the
+# SpoonOS path (object with .role/.content).
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+_SPOON_SYSTEM_MSG = SimpleNamespace(role="system", content=SYSTEM_PROMPT)
+
+# Stub results start their explanation with this, so they (and the stub
+# entries already in the local store) are never served from the claim cache.
+FALLBACK_EXPLANATION_PREFIX = "Fallback evaluation:"
+
+# Semantic cache: a claim whose embedding is this close (cosine similarity)
+# to an already-evaluated claim reuses that evaluation, one confidence level lower.
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_TIMEOUT = 5.0  # seconds; the lookup runs before every LLM call, so keep it short
+SEMANTIC_CACHE_THRESHOLD = 0.92
+_CONFIDENCE_DOWNGRADE = {"high": "medium", "medium": "low", "low": "low"}
+
+# Circuit breaker: an LLM path that fails this many times in a row is skipped
+# for the cooldown, so a misconfigured provider doesn't cost a full
+# failure/timeout on every call.
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = 60.0  # seconds
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an LLM path whose circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """
+    Tracks consecutive provider failures for one LLM path. Only failures of
+    the call itself count; a reply that doesn't parse is not a provider fault.
+    """
+
+    def __init__(self, name: str, threshold: int = CIRCUIT_BREAKER_THRESHOLD) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.failures = 0
+        self.open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    def check(self) -> None:
+        if self.is_open():
+            raise CircuitOpenError(f"{self.name} path failed repeatedly, skipping")
+
+    def record_success(self) -> None:
+        # A call admitted before the breaker tripped may still succeed; the
+        # provider is evidently healthy, so close the breaker again.
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        # The count is not reset when the breaker opens, so after the cooldown
+        # a single further failure re-opens it straight away.
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+
 
+_spoon_breaker = _CircuitBreaker("SpoonOS")
+_openai_breaker = _CircuitBreaker("Direct OpenAI")
+# The semantic cache is optional, so one failed embedding disables it for the cooldown
+_embedding_breaker = _CircuitBreaker("Embedding", threshold=1)
+
+
+# claim_hash -> evaluation, seeded lazily from the local store
+_CLAIM_CACHE: dict[str, dict] | None = None
+_semantic_hashes: list[str] = []
+_semantic_matrix: np.ndarray | None = None  # one normalised embedding per row
+
+
+@functools.lru_cache(maxsize=4096)
 def hash_claim(claim_text: str) -> str:
     """
     Compute a deterministic hash for the claim so we can
     use it as a key for storage and on-chain indexing.
+
+    Results are memoised, since the same claim is typically hashed by the
+    agent, the claim cache and the UI in a single run.
+    """
+    return hashlib.sha256(claim_text.encode("utf-8"), usedforsecurity=False).digest().hex()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_manager() -> LLMManager:
     """
-    return hashlib.sha256(claim_text.encode("utf-8")).hexdigest()
+    Build the SpoonOS LLM manager once and reuse it, so repeated evaluations
+    share its parsed configuration and warm HTTP connections.
+    """
+    return LLMManager(ConfigurationManager())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """
+    Build the direct OpenAI client once and reuse its connection pool.
+
+    Raises straight away when OPENAI_API_KEY is unset, so the unconfigured
+    demo skips client setup entirely (failures are not memoised, so setting
+    the key later still works).
+    """
+    if not os.environ.get("OPENAI_API_KEY"):
+        raise RuntimeError("OPENAI_API_KEY is not set")
+
+    from openai import OpenAI
+
+    return OpenAI()  # uses OPENAI_API_KEY from environment
+
+
+def _copy_result(data: dict) -> dict:
+    # Callers may mutate the result, so never hand out the cached dict itself
+    return {**data, "factors": list(data.get("factors", []))}
+
+
+def _is_fallback(data: dict) -> bool:
+    return str(data.get("explanation", "")).startswith(FALLBACK_EXPLANATION_PREFIX)
+
+
+def _get_claim_cache() -> dict[str, dict]:
+    """
+    Return the exact-match claim cache, seeding it from the local store on
+    first use.
+    """
+    global _CLAIM_CACHE
+    if _CLAIM_CACHE is None:
+        _CLAIM_CACHE = {}
+        try:
+            store = _load_store()
+        except Exception as e:
+            print(f"[Cache] Could not seed claim cache from local store: {type(e).__name__}: {e}")
+            store = {}
+        for claim_hash, entry in store.items():
+            if not _is_fallback(entry):
+                _CLAIM_CACHE[claim_hash] = {"factors": [], **entry}
+    return _CLAIM_CACHE
+
+
+async def _embed_claim(claim: str) -> np.ndarray | None:
+    """
+    Return the normalised embedding of a claim, or None if embeddings are
+    unavailable (the semantic cache is then simply skipped).
+
+    The request uses a short timeout and no client-side retries, and a
+    failure opens the embedding breaker, so a broken embeddings endpoint
+    never holds up the SpoonOS call that follows.
+    """
+    if _embedding_breaker.is_open() or _openai_breaker.is_open():
+        return None
+    try:
+        client = _get_openai_client().with_options(timeout=EMBEDDING_TIMEOUT, max_retries=0)
+        resp = await asyncio.to_thread(
+            client.embeddings.create, model=EMBEDDING_MODEL, input=claim
+        )
+    except Exception as e:
+        _embedding_breaker.record_failure()
+        print(f"[Cache] Embedding failed, skipping semantic cache: {type(e).__name__}: {e}")
+        return None
+    _embedding_breaker.record_success()
+    vector = np.asarray(resp.data[0].embedding, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _semantic_lookup(embedding: np.ndarray) -> dict | None:
+    """
+    Return the cached evaluation of the most similar known claim, with its
+    confidence downgraded one level, if it clears SEMANTIC_CACHE_THRESHOLD.
+    """
+    if _semantic_matrix is None:
+        return None
+    similarities = _semantic_matrix @ embedding
+    best = int(np.argmax(similarities))
+    if similarities[best] <= SEMANTIC_CACHE_THRESHOLD:
+        return None
+    cached = _copy_result(_get_claim_cache()[_semantic_hashes[best]])
+    cached["confidence"] = _CONFIDENCE_DOWNGRADE.get(cached.get("confidence"), "low")
+    return cached
+
+
+def _remember(claim_hash: str, data: dict, embedding: np.ndarray | None) -> None:
+    global _semantic_matrix
+    _get_claim_cache()[claim_hash] = _copy_result(data)
+    if embedding is not None:
+        _semantic_hashes.append(claim_hash)
+        row = embedding[np.newaxis, :]
+        _semantic_matrix = row if _semantic_matrix is None else np.vstack([_semantic_matrix, row])
 
 
 async def evaluate_claim_with_spoon(claim: str) -> dict:
@@ -33,34 +224,55 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
     Use SpoonOS's unified LLM manager to evaluate a scientific claim.
 
     Flow:
+      0) Return a cached evaluation if this claim (or, via embeddings, a
+         near-identical one) has already been evaluated.
       1) Try Agent -> SpoonOS -> LLM (OpenAI) via LLMManager.chat(...)
       2) If that fails (e.g. ProviderError), fall back to a direct OpenAI call
          using the same messages.
       3) If that also fails, fall back to a deterministic stub so the demo
          always remains functional.
+
+    A path whose provider fails CIRCUIT_BREAKER_THRESHOLD times in a row is
+    skipped for CIRCUIT_BREAKER_COOLDOWN seconds, falling straight through to
+    the next one.
     """
-    config_manager = ConfigurationManager()
-    llm_manager = LLMManager(config_manager)
+    claim_hash = hash_claim(claim)
+    cached = _get_claim_cache().get(claim_hash)
+    if cached is not None:
+        print("\n[Cache] Exact match for claim hash, skipping LLM call.")
+        return _copy_result(cached)
+
+    embedding = await _embed_claim(claim)
+    if embedding is not None:
+        similar = _semantic_lookup(embedding)
+        if similar is not None:
+            print("\n[Cache] Semantically similar claim found, skipping LLM call.")
+            _get_claim_cache()[claim_hash] = similar
+            return _copy_result(similar)
 
     # Messages as simple dicts (used for direct OpenAI call)
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": f"Scientific claim: {claim}"},
-    ]
+    user_content = f"Scientific claim: {claim}"
+    messages = [_SYSTEM_MSG, {"role": "user", "content": user_content}]
 
     # Messages as objects with .role and .content (for SpoonOS path, to avoid
     # the `'dict' object has no attribute "role"` error in some adapters).
-    spoon_messages = [
-        SimpleNamespace(role="system", content=SYSTEM_PROMPT),
-        SimpleNamespace(role="user", content=f"Scientific claim: {claim}"),
-    ]
+    spoon_messages = [_SPOON_SYSTEM_MSG, SimpleNamespace(role="user", content=user_content)]
 
     # 1) Primary path: SpoonOS -> OpenAI via LLMManager
     try:
+        _spoon_breaker.check()
+
         print("\n[SpoonOS] Calling LLMManager.chat(...) via unified protocol layer...")
-        response = await llm_manager.chat(spoon_messages)
+        try:
+            llm_manager = _get_llm_manager()
+            response = await llm_manager.chat(spoon_messages)
+        except Exception:
+            _spoon_breaker.record_failure()
+            raise
+        _spoon_breaker.record_success()
+
         content = getattr(response, "content", None) or str(response)
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         # Normalise and return
         data.setdefault("score", 50)
@@ -68,6 +280,7 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
         data.setdefault("explanation", "No explanation provided.")
         data.setdefault("factors", [])
 
+        _remember(claim_hash, data, embedding)
         return data
 
     except Exception as e:
@@ -76,16 +289,28 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
 
         # 2) Secondary path: direct OpenAI call using the same messages
         try:
-            from openai import OpenAI
-
-            client = OpenAI()  # uses OPENAI_API_KEY from environment
-
-            resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-            )
+            _openai_breaker.check()
+
+            try:
+                client = _get_openai_client()
+
+                # The OpenAI client is synchronous; run it in a worker thread so
+                # concurrent evaluations (see evaluate_claims_batch) don't block.
+                resp = await asyncio.to_thread(
+                    client.chat.completions.create,
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    # JSON mode: the reply is guaranteed to parse as a JSON object
+                    response_format={"type": "json_object"},
+                )
+            except Exception:
+                _openai_breaker.record_failure()
+                raise
+            _openai_breaker.record_success()
+
+            # orjson parses the str's UTF-8 buffer directly; no need to encode first
             content = resp.choices[0].message.content
-            data = json.loads(content)
+            data = orjson.loads(content)
 
             # Normalise
             data.setdefault("score", 50)
@@ -94,6 +319,7 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
             data.setdefault("factors", [])
 
             print("[OpenAI] Direct call succeeded.")
+            _remember(claim_hash, data, embedding)
             return data
 
         except Exception as e2:
@@ -104,7 +330,7 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
                 "score": 60,
                 "confidence": "medium",
                 "explanation": (
-                    "Fallback evaluation: both SpoonOS and direct LLM calls failed or "
+                    f"{FALLBACK_EXPLANATION_PREFIX} both SpoonOS and direct LLM calls failed or "
                     "are not yet fully configured. In a full deployment this would "
                     "always be replaced by successful LLM reasoning."
                 ),
@@ -117,12 +343,294 @@ async def evaluate_claim_with_spoon(claim: str) -> dict:
             return data
 
 
+BATCH_CONCURRENCY = 10
+BATCH_MAX_ATTEMPTS = 3
+BATCH_RETRY_BASE_DELAY = 1.0  # seconds; doubled after each failed attempt
+
+
+async def evaluate_claims_batch(
+    claims: list[str],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> list[dict | BaseException]:
+    """
+    Evaluate many claims concurrently, at most `concurrency` at a time.
+
+    evaluate_claim_with_spoon never raises for LLM errors; it degrades to the
+    stub instead. A stub result is therefore what a transient failure (rate
+    limit, timeout) looks like here, so such claims are retried with
+    exponential backoff, up to BATCH_MAX_ATTEMPTS attempts in total. Retries
+    stop early while both LLM circuit breakers are open, since nothing can
+    succeed until the cooldown ends.
+
+    Results come back in the same order as `claims`; a claim that still
+    fails keeps its stub result, and any unexpected exception is returned in
+    place of its result rather than aborting the whole batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(claim: str) -> dict:
+        async with semaphore:
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                result = await evaluate_claim_with_spoon(claim)
+                if not _is_fallback(result):
+                    return result
+                if attempt == BATCH_MAX_ATTEMPTS - 1:
+                    break
+                if _spoon_breaker.is_open() and _openai_breaker.is_open():
+                    break
+                delay = BATCH_RETRY_BASE_DELAY * 2 ** attempt
+                print(f"[VeriSci] Evaluation fell back to the stub, retrying in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+            return result
+
+    return await asyncio.gather(*(_one(c) for c in claims), return_exceptions=True)
+
+
+# Local append-only JSONL store used by StoreEvaluationTool: one evaluation
+# per line, later lines for the same claim_hash superseding earlier ones.
+STORE_DIR = "data"
+STORE_PATH = os.path.join(STORE_DIR, "verisci_store.jsonl")
+LEGACY_STORE_PATH = os.path.join(STORE_DIR, "verisci_store.json")
+STORE_FLUSH_DELAY = 0.5  # seconds; bursts of stores are coalesced into one write
+STORE_FSYNC_EVERY = 16  # flushes between fsyncs; the file is also synced at exit
+STORE_WRITE_BUFFER = 64 * 1024
+STORE_COMPACT_RATIO = 2  # rewrite the file once it holds 2x the live records
+
+# The store is loaded once and kept in memory; new records are encoded up
+# front, queued as JSONL lines and appended by a background task, so each store is a dict update rather than a
+# full read-parse-rewrite of the file. The file itself stays open for the
+# life of the process.
+_STORE_CACHE: dict | None = None
+_store_lines = 0
+_pending_lines: list[bytes] = []  # encoded records, each ending in b"\n"
+_dirty_event: asyncio.Event | None = None
+_flusher_task: asyncio.Task | None = None
+_store_fd: int | None = None
+_unsynced_flushes = 0
+# Reusable scratch buffer the queued lines are serialised into before each
+# write, so flushes don't allocate a fresh joined buffer every time.
+_scratch = bytearray(STORE_WRITE_BUFFER)
+
+
+def _get_fd() -> int:
+    """
+    Return the persistent read/append descriptor for the store, opening
+    (and creating) the file on first use.
+    """
+    global _store_fd
+    if _store_fd is None:
+        os.makedirs(STORE_DIR, exist_ok=True)
+        _store_fd = os.open(STORE_PATH, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    return _store_fd
+
+
+def _close_fd() -> None:
+    global _store_fd, _unsynced_flushes
+    if _store_fd is not None:
+        os.close(_store_fd)
+        _store_fd = None
+        _unsynced_flushes = 0
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _serialise_pending() -> memoryview:
+    """
+    Copy the queued lines into the scratch buffer, growing it if needed, and
+    return a view of the filled part.
+    """
+    size = 0
+    for line in _pending_lines:
+        end = size + len(line)
+        if end > len(_scratch):
+            _scratch.extend(bytes(max(end, 2 * len(_scratch)) - len(_scratch)))
+        _scratch[size:end] = line
+        size = end
+    return memoryview(_scratch)[:size]
+
+
+def _drop_written(written: int) -> None:
+    """
+    Remove the first `written` bytes' worth of lines from the queue. A line
+    that was only partly written keeps its unwritten remainder, so a retried
+    flush finishes it rather than appending the whole line again.
+    """
+    global _store_lines
+    done = 0
+    for line in _pending_lines:
+        if written < len(line):
+            break
+        written -= len(line)
+        done += 1
+    del _pending_lines[:done]
+    _store_lines += done
+    if written:
+        _pending_lines[0] = _pending_lines[0][written:]
+
+
+def _load_store() -> dict:
+    """
+    Return the in-memory store, loading it from disk on first use.
+
+    A store left behind in the old single-object JSON format is migrated to
+    JSONL the first time it is loaded.
+    """
+    global _STORE_CACHE, _store_lines
+    if _STORE_CACHE is None:
+        store = {}
+        fd = _get_fd()
+        if os.fstat(fd).st_size == 0 and os.path.exists(LEGACY_STORE_PATH):
+            with open(LEGACY_STORE_PATH, "rb") as f:
+                store = orjson.loads(f.read())
+            _STORE_CACHE = store
+            _compact_store()
+            return _STORE_CACHE
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        lines = 0
+        offset = 0
+        good_end = 0  # end of the last newline-terminated line
+        torn_tail = False
+        with open(fd, "rb", closefd=False) as f:
+            for line in f:
+                offset += len(line)
+                complete = line.endswith(b"\n")
+                if complete:
+                    good_end = offset
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Torn final line from an interrupted append
+                    torn_tail = not complete
+                    continue
+                if not complete:
+                    # Intact line that just lost its newline; restore it so
+                    # the next append starts on a fresh line.
+                    _write_all(fd, b"\n")
+                # Junk lines still count towards the next compaction
+                lines += 1
+                if not isinstance(record, dict) or not isinstance(record.get("claim_hash"), str):
+                    # Valid JSON but not a store record; skip it like a torn line
+                    continue
+                store[record.pop("claim_hash")] = record
+        if torn_tail:
+            # Cut the partial record off, or the next O_APPEND write would be
+            # glued onto it and lost on reload.
+            os.ftruncate(fd, good_end)
+        _store_lines = lines
+        _STORE_CACHE = store
+    return _STORE_CACHE
+
+
+def _compact_store() -> None:
+    """
+    Rewrite the store with one line per live record. The new file is written
+    to a temporary path and swapped into place, so a crash mid-write never
+    leaves a truncated store behind.
+    """
+    global _store_lines
+    os.makedirs(STORE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=STORE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=STORE_WRITE_BUFFER) as f:
+            for claim_hash, entry in _STORE_CACHE.items():
+                f.write(orjson.dumps({"claim_hash": claim_hash, **entry}))
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, STORE_PATH)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    # The open descriptor still points at the replaced file
+    _close_fd()
+    _store_lines = len(_STORE_CACHE)
+
+
+def flush_store() -> None:
+    """
+    Append any pending records to disk immediately.
+
+    Called by the background flusher and at interpreter exit, so evaluations
+    stored just before the process ends are not lost. The file is fsynced
+    every STORE_FSYNC_EVERY flushes rather than on each one.
+    """
+    global _unsynced_flushes
+    if not _pending_lines:
+        return
+    fd = _get_fd()
+    written = 0
+    try:
+        # Release the view before the next flush may need to grow the buffer
+        with _serialise_pending() as view:
+            while written < len(view):
+                written += os.write(fd, view[written:])
+    finally:
+        # Even if the write failed part-way, forget what already reached disk
+        _drop_written(written)
+
+    _unsynced_flushes += 1
+    if _unsynced_flushes >= STORE_FSYNC_EVERY:
+        os.fsync(fd)
+        _unsynced_flushes = 0
+
+    if _store_lines > STORE_COMPACT_RATIO * len(_STORE_CACHE):
+        _compact_store()
+
+
+def close_store() -> None:
+    """
+    Flush pending records, sync the store to disk and close it.
+    """
+    try:
+        flush_store()
+    except Exception as e:
+        log.warning("[StoreEvaluationTool] Failed to flush local store: %s: %s", type(e).__name__, e)
+    if _store_fd is not None and _unsynced_flushes:
+        os.fsync(_store_fd)
+    _close_fd()
+
+
+async def _flusher(dirty_event: asyncio.Event) -> None:
+    while True:
+        await dirty_event.wait()
+        await asyncio.sleep(STORE_FLUSH_DELAY)
+        dirty_event.clear()
+        try:
+            flush_store()
+        except Exception as e:
+            log.warning("[StoreEvaluationTool] Failed to flush local store: %s: %s", type(e).__name__, e)
+
+
+def _schedule_flush() -> None:
+    """
+    Make sure a flusher is running on the current event loop (callers may
+    use a fresh loop per asyncio.run) and wake it up.
+    """
+    global _dirty_event, _flusher_task
+    loop = asyncio.get_running_loop()
+    if _flusher_task is None or _flusher_task.done() or _flusher_task.get_loop() is not loop:
+        _dirty_event = asyncio.Event()
+        _flusher_task = loop.create_task(_flusher(_dirty_event))
+    _dirty_event.set()
+
+
+atexit.register(close_store)
+
+
 class StoreEvaluationTool(BaseTool):
     """
     Simple SpoonOS tool that 'stores' a VeriSci evaluation.
 
     For the hackathon prototype, this tool logs the result and writes it
-    to a local JSON file. In a fuller version, it could write to a database,
+    to a local JSONL file. In a fuller version, it could write to a database,
     file, or external storage.
     """
     name: str = "store_evaluation"
@@ -158,51 +666,79 @@ class StoreEvaluationTool(BaseTool):
         explanation: str,
     ) -> str:
         """
-        Store the evaluation locally in a JSON file.
+        Store the evaluation locally in a JSONL file.
+
+        The evaluation is recorded in the in-memory store straight away and
+        appended to disk shortly afterwards by a background flusher.
 
         For the hackathon prototype, this demonstrates a concrete storage
         mechanism behind the tool. In a fuller version, this could be swapped
         for a database or decentralised storage.
         """
-        print("\n[StoreEvaluationTool] Storing evaluation:")
-        print(f"  claim_hash:  {claim_hash}")
-        print(f"  score:       {score}")
-        print(f"  confidence:  {confidence}")
-        print(f"  explanation: {explanation[:120]}...")
+        log.debug(
+            "[StoreEvaluationTool] Storing evaluation: claim_hash=%s score=%s confidence=%s explanation=%.120s",
+            claim_hash, score, confidence, explanation,
+        )
 
-        # Simple local JSON store: data/verisci_store.json
+        # Simple local JSONL store: data/verisci_store.jsonl
         try:
-            import os
+            store = _load_store()
 
-            os.makedirs("data", exist_ok=True)
-            store_path = os.path.join("data", "verisci_store.json")
-
-            # Load existing store if present
-            if os.path.exists(store_path):
-                with open(store_path, "r", encoding="utf-8") as f:
-                    store = json.load(f)
-            else:
-                store = {}
-
-            # Update entry for this claim
-            store[claim_hash] = {
+            # Encode first, so a record orjson rejects (e.g. an int beyond
+            # 64 bits) is refused here instead of wedging the write queue.
+            entry = {
                 "score": score,
                 "confidence": confidence,
                 "explanation": explanation,
             }
+            line = orjson.dumps({"claim_hash": claim_hash, **entry}) + b"\n"
 
-            # Write back to disk
-            with open(store_path, "w", encoding="utf-8") as f:
-                json.dump(store, f, indent=2)
+            # Update entry for this claim; the append to disk is debounced
+            store[claim_hash] = entry
+            _pending_lines.append(line)
+            _schedule_flush()
 
-            print("[StoreEvaluationTool] Stored evaluation in data/verisci_store.json.")
+            log.debug("[StoreEvaluationTool] Stored evaluation in %s.", STORE_PATH)
             return "stored"
         except Exception as e:
-            print(f"[StoreEvaluationTool] Failed to write to local store: {type(e).__name__}: {e}")
+            log.warning("[StoreEvaluationTool] Failed to write to local store: %s: %s", type(e).__name__, e)
             # Still return a value so the agent can continue.
             return "error"
 
 
+# Confidence labels in the order of their on-chain codes (see ClaimRegistry).
+CONFIDENCE_LEVELS = ("low", "medium", "high")
+
+
+def encode_claim_payload(score: int, confidence: str, explanation: str) -> bytes:
+    """
+    Pack an evaluation the way ClaimRegistry.submitClaim stores it:
+    one score byte, one confidence byte, then the UTF-8 explanation.
+
+    Raises ValueError if the score is outside 0-100 or the confidence label
+    is unknown.
+    """
+    if not 0 <= score <= 100:
+        raise ValueError(f"score out of range: {score}")
+    if confidence not in CONFIDENCE_LEVELS:
+        raise ValueError(f"unknown confidence label: {confidence!r}")
+    return bytes([score, CONFIDENCE_LEVELS.index(confidence)]) + explanation.encode("utf-8")
+
+
+def decode_claim_payload(payload: bytes) -> dict | None:
+    """
+    Unpack a ClaimRegistry.getClaim payload, or return None for an unknown
+    claim (empty payload).
+    """
+    if not payload:
+        return None
+    return {
+        "score": payload[0],
+        "confidence": CONFIDENCE_LEVELS[payload[1]],
+        "explanation": payload[2:].decode("utf-8"),
+    }
+
+
 def submit_to_neo_stub(claim_hash: str, score: int, confidence: str, explanation: str) -> None:
     """
     Stub for submitting the evaluation to the Neo ClaimRegistry smart contract.
@@ -217,6 +753,12 @@ def submit_to_neo_stub(claim_hash: str, score: int, confidence: str, explanation
     print(f"  score:       {score}")
     print(f"  confidence:  {confidence}")
     print(f"  explanation: {explanation[:120]}...")
+    try:
+        payload = encode_claim_payload(score, confidence, explanation)
+        print(f"  payload:     {len(payload)} bytes")
+    except ValueError as e:
+        # submitClaim would reject this too (score outside 0-100 or unknown label)
+        print(f"  payload:     not encodable ({e})")
     print("[NeoStub] (Stub) This is where a real Neo RPC call would be made.")
 
 
@@ -262,4 +804,10 @@ async def agent_run() -> None:
 
 
 if __name__ == "__main__":
+    # Configure only our own logger, so third-party INFO logs (e.g. httpx
+    # request lines) stay hidden as before.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
     asyncio.run(agent_run())
@@ -2,7 +2,11 @@ from boa3.builtin import public
 from boa3.builtin.interop.storage import get, put
 
 # VeriSci Claim Registry
-# Stores: claimHash (string) -> "score|confidence|explanation"
+# Stores: claimHash (string) -> [score][confidence] + explanation
+#   byte 0:  score (0-100)
+#   byte 1:  confidence (0 = low, 1 = medium, 2 = high)
+#   byte 2+: explanation, UTF-8
+# Storage is charged per byte, so the header is kept to a fixed 2 bytes.
 
 @public
 def submitClaim(claim_hash: str, score: int, confidence: str, explanation: str) -> bool:
@@ -12,18 +16,35 @@ def submitClaim(claim_hash: str, score: int, confidence: str, explanation: str)
     """
     if len(claim_hash) == 0:
         return False
+    if score < 0 or score > 100:
+        return False
+
+    # NeoVM encodes 0 as empty bytes, so the zero score is spelled out; 1-100
+    # fit in a single (signed little-endian) byte.
+    if score == 0:
+        header = b'\x00'
+    else:
+        header = score.to_bytes()
+
+    if confidence == "low":
+        header = header + b'\x00'
+    elif confidence == "medium":
+        header = header + b'\x01'
+    elif confidence == "high":
+        header = header + b'\x02'
+    else:
+        return False
 
-    # Very simple serialisation: "score|confidence|explanation"
-    payload = str(score) + "|" + confidence + "|" + explanation
+    payload = header + explanation.to_bytes()
     put(claim_hash, payload)
     return True
 
 
 @public
-def getClaim(claim_hash: str) -> str:
+def getClaim(claim_hash: str) -> bytes:
     """
-    Returns "score|confidence|explanation" for a given claim hash,
-    or an empty string if not found.
+    Returns the packed [score][confidence] + explanation payload for a given
+    claim hash, or empty bytes if not found. Decode it client-side (see
+    decode_claim_payload in agent/verisci_agent.py).
     """
-    result = get(claim_hash).to_str()
-    return result
\ No newline at end of file
+    return get(claim_hash)
@@ -1,5 +1,9 @@
+import asyncio
 import os
 import sys
+import threading
+
+import streamlit as st
 
 # Ensure project root is on the Python path so 'agent' can be imported
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -9,10 +13,17 @@ if ROOT_DIR not in sys.path:
 from agent.verisci_agent import evaluate_claim_with_spoon, hash_claim
 
 
-import asyncio
-import streamlit as st
-
-from agent.verisci_agent import evaluate_claim_with_spoon, hash_claim
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Run a single event loop in a background thread for the lifetime of the
+    app. Streamlit re-runs this script on every interaction, so the loop is
+    cached as a resource; reusing it keeps the LLM clients' connection pools
+    alive between evaluations instead of tearing them down per click.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
 
 
 st.title("VeriSci – Scientific Claim Credibility Checker")
@@ -29,7 +40,9 @@ if st.button("Evaluate claim"):
         st.warning("Please enter a claim first.")
     else:
         with st.spinner("Evaluating via SpoonOS..."):
-            result = asyncio.run(evaluate_claim_with_spoon(claim))
+            result = asyncio.run_coroutine_threadsafe(
+                evaluate_claim_with_spoon(claim), get_event_loop()
+            ).result()
         st.subheader("Result")
         st.json(result)
 